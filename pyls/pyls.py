@@ -1,49 +1,112 @@
-import json
+import functools
 import os
-import argparse
+import sys
 import time
+from itertools import islice
+from operator import itemgetter
+from types import SimpleNamespace
+
+# Prefer the faster third-party JSON parsers when they are installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+# Directory structure listed by the command line interface
+STRUCTURE_JSON = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'structure.json'))
+
+# Size thresholds used by human_readable_size
+KB = 1024
+MB = 1024 ** 2
+GB = 1024 ** 3
+
+# Date format used for the time_modified column
+TIME_FORMAT = '%b %d %H:%M'
+
+# Number of entries formatted before each write to stdout
+OUTPUT_CHUNK_SIZE = 1024
+
+# Sort key for the -t option, indexing the records built by list_top_level_files
+time_modified_key = itemgetter(3)
 
 def format_permissions(permissions):
     """Format the permission string, ensuring it's 10 characters long."""
-    return permissions.ljust(10)
+    return permissions if len(permissions) >= 10 else permissions.ljust(10)
 
+@functools.lru_cache(maxsize=8192)
 def format_time(timestamp):
-    """Convert the Unix timestamp to a human-readable date format."""
-    return time.strftime('%b %d %H:%M', time.localtime(timestamp))
+    """Convert the Unix timestamp to a human-readable date format; cached since entries often share timestamps."""
+    return time.strftime(TIME_FORMAT, time.localtime(timestamp))
 
 def human_readable_size(size):
     """Convert file size to human-readable format."""
-    if size < 1024:
+    if size < KB:
         return f"{size}B"
-    elif size < 1024 ** 2:
-        return f"{size / 1024:.1f}K"
-    elif size < 1024 ** 3:
-        return f"{size / 1024 ** 2:.1f}M"
+    elif size < MB:
+        return "%.1fK" % (size / KB)
+    elif size < GB:
+        return "%.1fM" % (size / MB)
     else:
-        return f"{size / 1024 ** 3:.1f}G"
+        return "%.1fG" % (size / GB)
 
 def find_path_in_structure(data, path_parts):
     """
-    Recursively finds a file or directory in the structure based on the path_parts.
+    Finds a file or directory in the structure based on the path_parts.
+
+    Each path part is resolved through the node's '_index' name lookup, which is built the
+    first time a directory is searched.
 
     :param data: Dictionary representing the current directory structure.
     :param path_parts: List of path parts (e.g., ['parser', 'parser.go']).
     :return: The found file or directory, or None if not found.
     """
-    if not path_parts:
-        return data
+    node = data
+    for part in path_parts:
+        index = node.get('_index')
+        if index is None:
+            contents = node.get('contents')
+            if contents is None:
+                return None  # Files have no children
+            # Index directories on first access, so unvisited subtrees cost nothing
+            index = node['_index'] = index_contents(contents)
+        node = index.get(part)
+        if node is None:
+            return None  # Path not found
+    return node
 
-    current_part = path_parts[0]
-    contents = data.get('contents', [])
+def index_contents(contents):
+    """
+    Map the names of a directory's entries to the entries themselves.
 
-    for item in contents:
-        if item.get('name') == current_part:
-            if len(path_parts) == 1:
-                return item  # Return this item if it's the last part of the path
-            if 'contents' in item:
-                return find_path_in_structure(item, path_parts[1:])  # Recurse into subdirectory
+    :param contents: List of files and directories.
+    :return: Dictionary of name to entry; the first entry wins on duplicate names.
+    """
+    return {item.get('name'): item for item in reversed(contents)}
 
-    return None  # Path not found
+def write_joined(strings, separator):
+    """
+    Write strings to stdout joined by separator and followed by a newline.
+
+    Output is written in chunks of OUTPUT_CHUNK_SIZE strings, rather than one write per
+    string or one string holding the whole listing.
+
+    :param strings: Iterable of strings to write.
+    :param separator: String written between consecutive strings.
+    """
+    write = sys.stdout.write
+    strings = iter(strings)
+    chunk = list(islice(strings, OUTPUT_CHUNK_SIZE))
+    write(separator.join(chunk))
+    while True:
+        chunk = list(islice(strings, OUTPUT_CHUNK_SIZE))
+        if not chunk:
+            break
+        write(separator)
+        write(separator.join(chunk))
+    write("\n")
 
 def list_top_level_files(data, path="", show_all=False, detailed=False, reverse=False, sort_by_time=False,
                          filter_by=None, human_readable=False):
@@ -60,82 +123,107 @@ def list_top_level_files(data, path="", show_all=False, detailed=False, reverse=
     :param human_readable: Boolean, if True, converts sizes to human-readable format (like ls -h)
     :return: A list of top-level files and directories, optionally including hidden ones.
     """
-    # Split the path into parts
-    path_parts = path.split('/') if path else []
-
-    # Find the item corresponding to the given path
-    item = find_path_in_structure(data, path_parts)
+    # Find the item corresponding to the given path; an empty path is the top level itself
+    if not path:
+        item = data
+    else:
+        item = find_path_in_structure(data, path.split('/') if '/' in path else [path])
 
     if item is None:
         print(f"error: cannot access \'{path}\': No such file or directory")
         return
     if 'contents' in item:
         # If it's a directory, list its contents
-        contents = item['contents']
-        top_level_items = []
-        for entry in contents:
-            name = entry.get("name", "")
-            permissions = entry.get("permissions", "")
-            size = entry.get("size", 0)
-            time_modified = entry.get("time_modified", 0)
-            is_directory = "contents" in entry  # Determine if the item is a directory
-
-            # Skip hidden files (those starting with a '.'), unless -A is passed
-            if show_all or not name.startswith('.'):
-                # Apply filtering based on the --filter option
-                if filter_by:
-                    if filter_by == "file" and is_directory:
-                        continue  # Skip directories when filtering for files
-                    if filter_by == "dir" and not is_directory:
-                        continue  # Skip files when filtering for directories
-                    if filter_by != "dir" and  filter_by != "file":
-                        print("error: {0} is not a valid filter criteria. Available filters are 'dir' and 'file'".format(filter_by))
-                        break
-                top_level_items.append({
-                    'name': name,
-                    'permissions': permissions,
-                    'size': size,
-                    'time_modified': time_modified,
-                    'is_directory': is_directory
-                })
+        if filter_by and filter_by not in ('file', 'dir'):
+            print("error: {0} is not a valid filter criteria. Available filters are 'dir' and 'file'".format(filter_by))
+            return
+        # Apply filtering based on the --filter option
+        want_dirs = filter_by != 'file'
+        want_files = filter_by != 'dir'
+
+        # Collect (name, permissions, size, time_modified, is_directory) records,
+        # skipping hidden files (those starting with a '.') unless -A is passed
+        try:
+            top_level_items = [
+                (entry["name"], entry["permissions"], entry["size"], entry["time_modified"], "contents" in entry)
+                for entry in item['contents']
+                if (show_all or not entry["name"].startswith('.'))
+                and (want_dirs if "contents" in entry else want_files)
+            ]
+        except KeyError:
+            # Some entries are missing fields, fall back to defaults for them
+            top_level_items = [
+                (entry.get("name", ""), entry.get("permissions", ""), entry.get("size", 0),
+                 entry.get("time_modified", 0), "contents" in entry)
+                for entry in item['contents']
+                if (show_all or not entry.get("name", "").startswith('.'))
+                and (want_dirs if "contents" in entry else want_files)
+            ]
         # Sort by time_modified if -t is passed
         if sort_by_time:
-            top_level_items.sort(key=lambda x: x['time_modified'])
+            top_level_items.sort(key=time_modified_key)
 
         # Reverse the list if -r is passed
         if reverse:
             top_level_items.reverse()
 
         if detailed:
-            for item in top_level_items:
-                formatted_permissions = format_permissions(item['permissions'])
-                formatted_time = format_time(item['time_modified'])
-                size = human_readable_size(entry['size']) if human_readable else entry['size']
-                print(f"{formatted_permissions} {size:>8} {formatted_time} {item['name']}")
+            # Entries with the same timestamp share one cached format_time result
+            lines = (
+                f"{permissions if len(permissions) >= 10 else permissions.ljust(10)} "
+                f"{(human_readable_size(size) if human_readable else size):>8} "
+                f"{format_time(time_modified)} {name}"
+                for name, permissions, size, time_modified, _ in top_level_items
+            )
+            if top_level_items:
+                write_joined(lines, "\n")
         else:
-            print(" ".join(item['name'] for item in top_level_items))
+            write_joined((record[0] for record in top_level_items), " ")
     else:
         # If it's a file, just print its info
         if detailed:
             formatted_permissions = format_permissions(item['permissions'])
             formatted_time = format_time(item['time_modified'])
-            size = human_readable_size(entry['size']) if human_readable else entry['size']
+            size = human_readable_size(item['size']) if human_readable else item['size']
             print(f"{formatted_permissions} {size:>8} {formatted_time} ./{path}")
         else:
             print(item['name'])
-    return [item['name'] for item in top_level_items]
+        return [item['name']]
+    return [record[0] for record in top_level_items]
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(abs_path, mtime_ns):
+    """Parse the JSON file; cached per (path, modification time)."""
+    with open(abs_path, 'rb') as file:
+        return json_loads(file.read())
 
 def load_json_file(file_path):
     """
     Load the JSON file containing the directory structure.
-    
+
+    Parsed structures are cached in memory and reused until the file is modified, so every
+    caller gets the same dictionary; callers must not mutate the result.
+
     :param file_path: Path to the JSON file
     :return: Parsed JSON content as a dictionary
     """
-    with open(file_path, 'r') as file:
-        return json.load(file)
+    abs_path = os.path.abspath(file_path)
+    return _load_json_cached(abs_path, os.stat(abs_path).st_mtime_ns)
+
+# Parsed arguments for a bare `pyls` invocation, matching the parser defaults
+DEFAULT_ARGS = dict(path='', A=False, l=False, r=False, t=False, H=False, filter=None)
+
+def build_parser():
+    """
+    Build the argument parser for the command line interface.
+
+    argparse is imported here rather than at module level, so it is only loaded
+    when parse_simple_args cannot handle the command line.
+
+    :return: A configured argparse.ArgumentParser
+    """
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(
         description="pyls - A Python-based implementation of the 'ls' command.",
         usage="This project can help you with multiple utility option for 'ls' command tool",
@@ -150,13 +238,63 @@ def main():
     parser.add_argument('-t', action='store_true', help="Sort files by time modified")
     parser.add_argument('-H', action='store_true', help="Show file sizes in human-readable format")
     parser.add_argument('--filter',  help="Filter the output by file or directory")
+    return parser
 
-    args = parser.parse_args()
+# Single-character flags understood by parse_simple_args
+FLAGS = frozenset('AlrtH')
+
+def parse_simple_args(argv):
+    """
+    Parse the common command lines without argparse.
+
+    Handles combined short flags (e.g. -lt), --filter VALUE, --filter=VALUE and a single path.
+    Anything else, including -h/--help and invalid input, is left to argparse.
+
+    :param argv: List of arguments excluding the program name.
+    :return: Namespace with the parsed options, or None if argparse is needed.
+    """
+    args = SimpleNamespace(**DEFAULT_ARGS)
+    seen_path = False
+    arguments = iter(argv)
+    for arg in arguments:
+        if arg == '--filter':
+            args.filter = next(arguments, None)
+            if args.filter is None or args.filter.startswith('-'):
+                return None
+        elif arg.startswith('--filter='):
+            args.filter = arg[len('--filter='):]
+        elif arg.startswith('-') and len(arg) > 1:
+            if arg.startswith('--') or not FLAGS.issuperset(arg[1:]):
+                return None
+            for flag in arg[1:]:
+                setattr(args, flag, True)
+        elif seen_path:
+            return None  # argparse reports the extra argument
+        else:
+            args.path = arg
+            seen_path = True
+    return args
+
+def parse_args(argv=None):
+    """
+    Parse the command line arguments.
+
+    :param argv: List of arguments excluding the program name (default: sys.argv[1:]).
+    :return: Namespace with the parsed options.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parse_simple_args(argv)
+    if args is None:
+        # Help, errors and less common syntax are handled by the full parser
+        args = build_parser().parse_args(argv)
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
 
-    json_file_path = os.path.join(os.path.dirname(__file__), '..', 'structure.json')
-    
     # Load directory structure from JSON
-    directory_data = load_json_file(json_file_path)
+    directory_data = load_json_file(STRUCTURE_JSON)
     # If detailed is enabled, print files in detailed format, otherwise, list normally
     # List files with options -A, -l, -t, -r, -H and --filter
     list_top_level_files(directory_data, path=args.path, show_all=args.A, detailed=args.l, reverse=args.r, sort_by_time=args.t,
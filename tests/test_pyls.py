@@ -1,6 +1,11 @@
 # tests/test_pyls.py
+import json
+import os
+import time
+
 import pytest
-from pyls.pyls import list_top_level_files
+from pyls.pyls import (OUTPUT_CHUNK_SIZE, TIME_FORMAT, build_parser, find_path_in_structure, format_time,
+                       human_readable_size, list_top_level_files, load_json_file, parse_args, write_joined)
 
 
 def test_list_files():
@@ -36,3 +41,129 @@ def test_hidden_files():
 
     result_with_hidden = list_top_level_files(sample_structure, show_all=True)
     assert result_with_hidden == ['.gitignore', 'LICENSE']
+
+
+def test_find_path_in_structure():
+    sample_structure = {
+        "name": "interpreter",
+        "contents": [
+            {"name": "LICENSE", "size": 1071},
+            {"name": "parser", "contents": [{"name": "parser.go", "size": 1622}]}
+        ]
+    }
+    assert find_path_in_structure(sample_structure, []) is sample_structure
+    assert find_path_in_structure(sample_structure, ['parser', 'parser.go'])['size'] == 1622
+    assert find_path_in_structure(sample_structure, ['parser', 'missing.go']) is None
+    assert find_path_in_structure(sample_structure, ['LICENSE', 'parser.go']) is None
+
+    # Searched directories are indexed on first access, unvisited ones are left alone
+    assert '_index' in sample_structure and '_index' in sample_structure['contents'][1]
+    assert '_index' not in find_path_in_structure(sample_structure, ['parser', 'parser.go'])
+
+
+@pytest.mark.parametrize("argv", [
+    [], ['ast'], ['-A', '-l'], ['-ltr', 'parser/parser.go'], ['-H', '--filter', 'dir'], ['--filter=file', '-t'],
+])
+def test_parse_args_matches_parser(argv):
+    assert vars(parse_args(argv)) == vars(build_parser().parse_args(argv))
+
+
+def test_detailed_listing_sizes(capsys):
+    sample_structure = {
+        "name": "interpreter",
+        "contents": [
+            {"name": "LICENSE", "size": 1071, "time_modified": 1699941437, "permissions": "-rw-r--r--"},
+            {"name": "README.md", "size": 83, "time_modified": 1699941437, "permissions": "-rw-r--r--"}
+        ]
+    }
+    list_top_level_files(sample_structure, detailed=True, human_readable=True)
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[1] for line in lines] == ['1.0K', '83B']
+
+    result = list_top_level_files(sample_structure, path="README.md", detailed=True)
+    assert result == ['README.md']
+    assert capsys.readouterr().out.split()[1] == '83'
+
+
+def test_entries_with_missing_fields():
+    sample_structure = {
+        "name": "interpreter",
+        "contents": [
+            {"name": "LICENSE", "size": 1071, "time_modified": 1699941437, "permissions": "-rw-r--r--"},
+            {"name": "README.md"}
+        ]
+    }
+    result = list_top_level_files(sample_structure, detailed=True, sort_by_time=True)
+    assert result == ['README.md', 'LICENSE']
+
+
+def test_sort_by_time():
+    sample_structure = {
+        "name": "interpreter",
+        "contents": [
+            {"name": "ast", "size": 4096, "time_modified": 1699957739, "permissions": "drwxr-xr-x", "contents": []},
+            {"name": "LICENSE", "size": 1071, "time_modified": 1699941437, "permissions": "-rw-r--r--"},
+            {"name": "README.md", "size": 83, "time_modified": 1699941437, "permissions": "-rw-r--r--"}
+        ]
+    }
+    assert list_top_level_files(sample_structure, sort_by_time=True) == ['LICENSE', 'README.md', 'ast']
+    assert list_top_level_files(sample_structure, sort_by_time=True, reverse=True) == ['ast', 'README.md', 'LICENSE']
+
+
+@pytest.mark.parametrize("size, expected", [
+    (0, "0B"), (1023, "1023B"), (1024, "1.0K"), (1280, "1.2K"), (1535, "1.5K"),
+    (1024 ** 2 - 1, "1024.0K"), (5 * 1024 ** 2, "5.0M"), (3 * 1024 ** 3 // 2, "1.5G"), (2 * 1024 ** 4, "2048.0G"),
+])
+def test_human_readable_size(size, expected):
+    assert human_readable_size(size) == expected
+
+
+def test_load_json_file_cache(tmp_path, monkeypatch):
+    structure_file = tmp_path / "structure.json"
+    structure_file.write_text(json.dumps({"name": "interpreter", "contents": [{"name": "LICENSE"}]}))
+
+    first = load_json_file(str(structure_file))
+    assert load_json_file(str(structure_file)) is first
+
+    # Relative and absolute paths share a cache entry
+    monkeypatch.chdir(tmp_path)
+    assert load_json_file("structure.json") is first
+
+    # A new modification time invalidates the cached structure
+    mtime_ns = os.stat(structure_file).st_mtime_ns
+    structure_file.write_text(json.dumps({"name": "interpreter", "contents": [{"name": "README.md"}]}))
+    os.utime(structure_file, ns=(mtime_ns + 10 ** 9, mtime_ns + 10 ** 9))
+    reloaded = load_json_file(str(structure_file))
+    assert reloaded is not first
+    assert [item["name"] for item in reloaded["contents"]] == ["README.md"]
+
+
+@pytest.mark.parametrize("count", [
+    0, 1, OUTPUT_CHUNK_SIZE - 1, OUTPUT_CHUNK_SIZE, OUTPUT_CHUNK_SIZE + 1, 2 * OUTPUT_CHUNK_SIZE, 3000,
+])
+@pytest.mark.parametrize("separator", [" ", "\n"])
+def test_write_joined_chunks(capsys, count, separator):
+    strings = [f"f{i}" for i in range(count)]
+    write_joined(iter(strings), separator)
+    assert capsys.readouterr().out == separator.join(strings) + "\n"
+
+
+@pytest.fixture
+def timezone(monkeypatch):
+    def set_timezone(name):
+        monkeypatch.setenv("TZ", name)
+        time.tzset()
+        format_time.cache_clear()
+    yield set_timezone
+    monkeypatch.undo()
+    time.tzset()
+    format_time.cache_clear()
+
+
+# Asia/Kolkata has a whole-minute offset; Africa/Monrovia was -0:44:30 until 1972
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="requires time.tzset")
+@pytest.mark.parametrize("zone", ["Asia/Kolkata", "Africa/Monrovia"])
+def test_format_time_matches_strftime(timezone, zone):
+    timezone(zone)
+    for timestamp in range(0, 70_000_000, 7919):
+        assert format_time(timestamp) == time.strftime(TIME_FORMAT, time.localtime(timestamp))